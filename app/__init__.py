@@ -1,8 +1,17 @@
 """MySQL Schema Diff Reporter package."""
 from .db import DatabaseConnection, ColumnInfo
-from .diff import SchemaDiff, TableDiff, compute_schema_diff
-from .render_markdown import build_markdown
+from .diff import (
+    SchemaDiff,
+    TableDiff,
+    TableChange,
+    compute_schema_diff,
+    iter_schema_diff,
+    collect_schema_diff
+)
+from .render_markdown import build_markdown, stream_markdown
 from .render_html import build_html
+from .render_model import RenderModel, get_render_model
+from .export import render_all_formats
 
 __version__ = "1.0.0"
 __all__ = [
@@ -10,7 +19,14 @@ __all__ = [
     'ColumnInfo',
     'SchemaDiff',
     'TableDiff',
+    'TableChange',
     'compute_schema_diff',
+    'iter_schema_diff',
+    'collect_schema_diff',
     'build_markdown',
-    'build_html'
+    'stream_markdown',
+    'build_html',
+    'RenderModel',
+    'get_render_model',
+    'render_all_formats'
 ]
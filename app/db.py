@@ -1,5 +1,6 @@
 """Database connection and schema introspection module."""
-from typing import Dict, Set, Optional, NamedTuple
+from itertools import groupby
+from typing import Dict, Set, Optional, NamedTuple, Iterator, Tuple
 import mysql.connector
 from mysql.connector.errors import Error as MySQLError
 
@@ -24,10 +25,10 @@ class DatabaseConnection:
         self.password = password
         self._conn = None
 
-    def connect(self, database: str) -> None:
-        """Establish connection to the MySQL database."""
+    def _open(self, database: str):
+        """Open a new connection to the given database."""
         try:
-            self._conn = mysql.connector.connect(
+            return mysql.connector.connect(
                 host=self.host,
                 port=self.port,
                 user=self.user,
@@ -37,6 +38,10 @@ class DatabaseConnection:
         except MySQLError as e:
             raise ConnectionError(f"Failed to connect to database: {e}")
 
+    def connect(self, database: str) -> None:
+        """Establish connection to the MySQL database."""
+        self._conn = self._open(database)
+
     def close(self) -> None:
         """Close the database connection."""
         if self._conn:
@@ -95,3 +100,50 @@ class DatabaseConnection:
             return columns
         finally:
             self.close()
+
+    def iter_columns(self, database: str) -> Iterator[Tuple[str, Dict[str, ColumnInfo]]]:
+        """Stream column information one base table at a time.
+
+        Rows are read through an unbuffered cursor and grouped per table, so
+        only a single table's columns are held in memory. Tables are yielded
+        in binary name order, which matches Python string ordering and lets
+        two streams be merge-joined. The generator uses its own connection,
+        so several streams can be consumed side by side.
+        """
+        conn = self._open(database)
+        try:
+            cursor = conn.cursor(buffered=False)
+            cursor.execute("""
+                SELECT 
+                    c.TABLE_NAME,
+                    c.COLUMN_NAME,
+                    c.DATA_TYPE,
+                    c.COLUMN_TYPE,
+                    c.IS_NULLABLE,
+                    c.COLUMN_DEFAULT,
+                    c.COLUMN_KEY,
+                    c.EXTRA
+                FROM information_schema.COLUMNS c
+                JOIN information_schema.TABLES t
+                    ON t.TABLE_SCHEMA = c.TABLE_SCHEMA
+                    AND t.TABLE_NAME = c.TABLE_NAME
+                WHERE c.TABLE_SCHEMA = %s
+                AND t.TABLE_TYPE = 'BASE TABLE'
+                ORDER BY CAST(c.TABLE_NAME AS BINARY), c.ORDINAL_POSITION
+            """, (database,))
+
+            for table_name, rows in groupby(cursor, key=lambda row: row[0]):
+                yield table_name, {
+                    row[1]: ColumnInfo(
+                        name=row[1],
+                        data_type=row[2],
+                        column_type=row[3],
+                        is_nullable=row[4],
+                        column_default=row[5],
+                        column_key=row[6],
+                        extra=row[7]
+                    )
+                    for row in rows
+                }
+        finally:
+            conn.close()
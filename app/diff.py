@@ -1,6 +1,6 @@
 """Schema difference calculation module."""
-from typing import Dict, Set, NamedTuple, Optional
-from dataclasses import dataclass
+from typing import Any, Dict, Set, NamedTuple, Optional, Iterable, Iterator, Tuple
+from dataclasses import dataclass, field
 from .db import ColumnInfo
 
 @dataclass
@@ -20,6 +20,10 @@ class SchemaDiff:
     added_tables: Set[str]
     removed_tables: Set[str]
     changed_tables: Dict[str, TableDiff]
+    # Render model cache, filled by render_model.get_render_model
+    _render_model: Optional[Any] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @property
     def has_changes(self) -> bool:
@@ -79,3 +83,71 @@ def compute_schema_diff(
         removed_tables=removed_tables,
         changed_tables=changed_tables
     )
+
+class TableChange(NamedTuple):
+    """A single table-level entry produced by the streaming diff."""
+    table: str
+    status: str  # 'added', 'removed' or 'changed'
+    diff: Optional[TableDiff] = None
+
+def _ordered_tables(
+    tables: Iterable[Tuple[str, Dict[str, ColumnInfo]]],
+    side: str
+) -> Iterator[Tuple[str, Dict[str, ColumnInfo]]]:
+    """Pass tables through, checking that names are strictly increasing."""
+    previous: Optional[str] = None
+    for table, columns in tables:
+        if previous is not None and table <= previous:
+            raise ValueError(
+                f"{side} tables are not in name order: {table!r} after {previous!r}"
+            )
+        previous = table
+        yield table, columns
+
+def iter_schema_diff(
+    old_columns: Iterable[Tuple[str, Dict[str, ColumnInfo]]],
+    new_columns: Iterable[Tuple[str, Dict[str, ColumnInfo]]]
+) -> Iterator[TableChange]:
+    """Sort-merge join two name-ordered table streams into table changes.
+
+    Both inputs yield ``(table_name, columns)`` pairs sorted by table name,
+    e.g. ``DatabaseConnection.iter_columns``. Only the current table from
+    each side is held in memory. Unchanged tables are skipped.
+    """
+    old_iter = _ordered_tables(old_columns, "Old")
+    new_iter = _ordered_tables(new_columns, "New")
+    old = next(old_iter, None)
+    new = next(new_iter, None)
+
+    while old is not None or new is not None:
+        if new is None or (old is not None and old[0] < new[0]):
+            yield TableChange(old[0], 'removed')
+            old = next(old_iter, None)
+        elif old is None or new[0] < old[0]:
+            yield TableChange(new[0], 'added')
+            new = next(new_iter, None)
+        else:
+            table_diff = diff_columns(old[0], old[1], new[1])
+            if table_diff.has_changes:
+                yield TableChange(old[0], 'changed', table_diff)
+            old = next(old_iter, None)
+            new = next(new_iter, None)
+
+def collect_schema_diff(changes: Iterable[TableChange]) -> SchemaDiff:
+    """Gather streamed table changes into a SchemaDiff."""
+    added_tables: Set[str] = set()
+    removed_tables: Set[str] = set()
+    changed_tables: Dict[str, TableDiff] = {}
+    for change in changes:
+        if change.status == 'added':
+            added_tables.add(change.table)
+        elif change.status == 'removed':
+            removed_tables.add(change.table)
+        else:
+            changed_tables[change.table] = change.diff
+
+    return SchemaDiff(
+        added_tables=added_tables,
+        removed_tables=removed_tables,
+        changed_tables=changed_tables
+    )
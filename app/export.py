@@ -0,0 +1,49 @@
+"""Render every export format for a schema diff in one call."""
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, NamedTuple, Optional
+from .diff import SchemaDiff
+from .render_html import build_html
+from .render_markdown import build_markdown
+from .render_model import get_render_model
+
+class ExportFormat(NamedTuple):
+    """Download metadata for an export format."""
+    label: str
+    file_name: str
+    mime_type: str
+
+EXPORT_FORMATS: Dict[str, ExportFormat] = {
+    'markdown': ExportFormat("Markdown", "schema_diff.md", "text/markdown"),
+    'html': ExportFormat("HTML", "schema_diff.html", "text/html"),
+    'json': ExportFormat("JSON", "reviewed.json", "application/json"),
+}
+
+def build_review_json(reviewed_tables: Optional[Dict[str, bool]] = None) -> str:
+    """Serialize the review status of each table."""
+    return json.dumps(reviewed_tables or {}, indent=2)
+
+def render_all_formats(
+    diff: SchemaDiff,
+    reviewed_tables: Optional[Dict[str, bool]] = None,
+    parallel: bool = False
+) -> Dict[str, str]:
+    """Render the Markdown, HTML and JSON exports together.
+
+    The shared render model is built once up front, so each format only
+    does its own string formatting. With ``parallel`` the formats are
+    rendered on a thread pool. Results are keyed as in ``EXPORT_FORMATS``.
+    """
+    get_render_model(diff)
+    renderers = {
+        'markdown': lambda: build_markdown(diff),
+        'html': lambda: build_html(diff, reviewed_tables),
+        'json': lambda: build_review_json(reviewed_tables),
+    }
+
+    if not parallel:
+        return {name: render() for name, render in renderers.items()}
+
+    with ThreadPoolExecutor(max_workers=len(renderers)) as executor:
+        futures = {name: executor.submit(render) for name, render in renderers.items()}
+        return {name: future.result() for name, future in futures.items()}
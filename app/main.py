@@ -1,5 +1,4 @@
 """MySQL Schema Diff Reporter - Streamlit Application."""
-import json
 import os
 import sys
 from pathlib import Path
@@ -12,9 +11,11 @@ import streamlit as st
 from mysql.connector.errors import Error as MySQLError
 
 from app.db import DatabaseConnection
-from app.diff import compute_schema_diff, SchemaDiff
+from app.diff import collect_schema_diff, iter_schema_diff, SchemaDiff
 from app.render_markdown import build_markdown
 from app.render_html import build_html
+from app.render_model import get_render_model
+from app.export import EXPORT_FORMATS, build_review_json, render_all_formats
 
 def init_session_state():
     """Initialize Streamlit session state variables."""
@@ -39,15 +40,11 @@ def handle_connection(
     try:
         db = DatabaseConnection(host, port, user, password)
         
-        # Fetch schemas
-        old_tables = db.fetch_tables(old_db)
-        new_tables = db.fetch_tables(new_db)
-        
-        old_columns = db.fetch_columns(old_db)
-        new_columns = db.fetch_columns(new_db)
-        
-        # Compute differences
-        diff = compute_schema_diff(old_tables, new_tables, old_columns, new_columns)
+        # Stream both schemas in table order and merge-join them
+        diff = collect_schema_diff(iter_schema_diff(
+            db.iter_columns(old_db),
+            db.iter_columns(new_db)
+        ))
         
         # Initialize reviewed state for new tables
         tables_to_review = set()
@@ -134,16 +131,17 @@ def main():
     # Main content
     if st.session_state.compare_clicked:
         diff = st.session_state.diff_result
-        if diff and diff.has_changes:
+        model = get_render_model(diff) if diff else None
+        if model and model.has_changes:
             # Summary
             st.header("Summary")
             cols = st.columns(3)
-            if diff.added_tables:
-                cols[0].metric("Added Tables", f"+{len(diff.added_tables)}")
-            if diff.removed_tables:
-                cols[1].metric("Removed Tables", f"-{len(diff.removed_tables)}")
-            if diff.changed_tables:
-                cols[2].metric("Changed Tables", len(diff.changed_tables))
+            if model.added_tables:
+                cols[0].metric("Added Tables", f"+{len(model.added_tables)}")
+            if model.removed_tables:
+                cols[1].metric("Removed Tables", f"-{len(model.removed_tables)}")
+            if model.changed_tables:
+                cols[2].metric("Changed Tables", len(model.changed_tables))
             
             # Review controls
             st.header("Review Status")
@@ -156,9 +154,9 @@ def main():
                     st.session_state.reviewed[table] = False
             
             # Added Tables
-            if diff.added_tables:
+            if model.added_tables:
                 st.header("Added Tables")
-                for table_name in sorted(diff.added_tables):
+                for table_name in model.added_tables:
                     with st.expander(f"➕ {table_name}"):
                         st.checkbox(
                             "Reviewed",
@@ -175,9 +173,9 @@ def main():
                         )
 
             # Removed Tables
-            if diff.removed_tables:
+            if model.removed_tables:
                 st.header("Removed Tables")
-                for table_name in sorted(diff.removed_tables):
+                for table_name in model.removed_tables:
                     with st.expander(f"➖ {table_name}"):
                         st.checkbox(
                             "Reviewed",
@@ -194,9 +192,10 @@ def main():
                         )
 
             # Changed Tables
-            if diff.changed_tables:
+            if model.changed_tables:
                 st.header("Changed Tables")
-                for table_name, table_diff in sorted(diff.changed_tables.items()):
+                for table in model.changed_tables:
+                    table_name = table.name
                     with st.expander(f"📝 {table_name}"):
                         st.checkbox(
                             "Reviewed",
@@ -208,31 +207,19 @@ def main():
                             )
                         )
                         
-                        if table_diff.added_columns:
+                        if table.added_columns:
                             st.markdown("##### Added Columns")
-                            for col_name, col_info in sorted(table_diff.added_columns.items()):
-                                info_text = f"{col_name} ({col_info.column_type})"
-                                if col_info.is_nullable == "NO":
-                                    info_text += " NOT NULL"
-                                if col_info.column_default:
-                                    info_text += f" DEFAULT {col_info.column_default}"
-                                if col_info.column_key:
-                                    info_text += f" {col_info.column_key}"
+                            for column in table.added_columns:
+                                info_text = f"{column.name} ({column.column_type}) {column.attributes}"
                                 st.markdown(
                                     f"<span style='color: #16a34a'>+ {info_text}</span>",
                                     unsafe_allow_html=True
                                 )
                         
-                        if table_diff.removed_columns:
+                        if table.removed_columns:
                             st.markdown("##### Removed Columns")
-                            for col_name, col_info in sorted(table_diff.removed_columns.items()):
-                                info_text = f"{col_name} ({col_info.column_type})"
-                                if col_info.is_nullable == "NO":
-                                    info_text += " NOT NULL"
-                                if col_info.column_default:
-                                    info_text += f" DEFAULT {col_info.column_default}"
-                                if col_info.column_key:
-                                    info_text += f" {col_info.column_key}"
+                            for column in table.removed_columns:
+                                info_text = f"{column.name} ({column.column_type}) {column.attributes}"
                                 st.markdown(
                                     f"<span style='color: #dc2626'>- {info_text}</span>",
                                     unsafe_allow_html=True
@@ -240,7 +227,7 @@ def main():
             
             # Export buttons
             st.header("Export")
-            col1, col2, col3 = st.columns(3)
+            col1, col2, col3, col4 = st.columns(4)
             
             if col1.button("Export Markdown"):
                 markdown = build_markdown(diff)
@@ -261,16 +248,25 @@ def main():
                 )
             
             if col3.button("Export Review Status"):
-                reviewed_json = json.dumps(
-                    st.session_state.reviewed,
-                    indent=2
-                )
+                reviewed_json = build_review_json(st.session_state.reviewed)
                 st.download_button(
                     "Download JSON",
                     reviewed_json,
                     "reviewed.json",
                     "application/json"
                 )
+            
+            if col4.button("Export All"):
+                exports = render_all_formats(diff, st.session_state.reviewed, parallel=True)
+                for name, content in exports.items():
+                    export_format = EXPORT_FORMATS[name]
+                    st.download_button(
+                        f"Download {export_format.label}",
+                        content,
+                        export_format.file_name,
+                        export_format.mime_type,
+                        key=f"download_all_{name}"
+                    )
         
         elif diff:
             st.info("No schema changes detected.")
@@ -1,35 +1,31 @@
 """HTML report generation module."""
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
-from jinja2 import Environment, FileSystemLoader
+from jinja2 import Environment, FileSystemLoader, Template
 from .diff import SchemaDiff
+from .render_model import get_render_model
+
+@lru_cache(maxsize=None)
+def _get_template() -> Template:
+    """Load the report template once and reuse it across renders."""
+    templates_dir = Path(__file__).parent / "templates"
+    env = Environment(loader=FileSystemLoader(str(templates_dir)))
+    return env.get_template("report.html.j2")
 
 def build_html(
     diff: SchemaDiff,
     reviewed_tables: Optional[Dict[str, bool]] = None
 ) -> str:
     """Generate an HTML report from schema differences."""
-    templates_dir = Path(__file__).parent / "templates"
-    env = Environment(loader=FileSystemLoader(str(templates_dir)))
-    template = env.get_template("report.html.j2")
-    
-    # Build summary text
-    summary_parts = []
-    if diff.added_tables:
-        summary_parts.append(f"+{len(diff.added_tables)} tables")
-    if diff.removed_tables:
-        summary_parts.append(f"-{len(diff.removed_tables)} tables")
-    if diff.changed_tables:
-        summary_parts.append(f"{len(diff.changed_tables)} tables changed")
-    summary = ", ".join(summary_parts) if summary_parts else None
-    
-    return template.render(
+    model = get_render_model(diff)
+    return _get_template().render(
         timestamp=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-        has_changes=diff.has_changes,
-        summary=summary,
-        added_tables=diff.added_tables,
-        removed_tables=diff.removed_tables,
-        changed_tables=diff.changed_tables,
+        has_changes=model.has_changes,
+        summary=model.summary,
+        added_tables=model.added_tables,
+        removed_tables=model.removed_tables,
+        changed_tables=model.changed_tables,
         reviewed=reviewed_tables or {}
     )
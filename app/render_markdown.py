@@ -1,94 +1,129 @@
 """Markdown report generation module."""
+import shutil
+import tempfile
 from datetime import datetime
-from typing import List
-from .diff import SchemaDiff, TableDiff
+from typing import Iterable, List, Optional, TextIO
+from .diff import SchemaDiff, TableChange
+from .render_model import (
+    ColumnView,
+    TableView,
+    build_column_view,
+    build_summary,
+    build_table_view,
+    get_render_model
+)
+
+def _format_column_view(column: ColumnView) -> str:
+    """Format a column view as a Markdown list entry body."""
+    return f"`{column.name}` `{column.column_type}` {column.attributes}"
 
 def format_column_info(column_name: str, info) -> str:
     """Format column information into a readable string."""
-    parts = [
-        f"`{column_name}`",
-        f"`{info.column_type}`",
-        "NULL" if info.is_nullable == "YES" else "NOT NULL"
-    ]
-    
-    if info.column_default is not None:
-        parts.append(f"DEFAULT {info.column_default}")
-    if info.column_key:
-        parts.append(info.column_key)
-    if info.extra:
-        parts.append(info.extra)
-        
-    return " ".join(parts)
+    return _format_column_view(build_column_view(column_name, info))
 
-def build_markdown(diff: SchemaDiff) -> str:
-    """Generate a Markdown report from schema differences."""
-    lines: List[str] = []
-    
-    # Header
-    lines.extend([
+def _header_lines() -> List[str]:
+    """Build the report title and timestamp lines."""
+    return [
         "# MySQL Schema Diff Report",
         f"Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
         ""
-    ])
-    
-    # Summary
-    summary = []
-    if diff.added_tables:
-        summary.append(f"+{len(diff.added_tables)} tables")
-    if diff.removed_tables:
-        summary.append(f"-{len(diff.removed_tables)} tables")
-    if diff.changed_tables:
-        summary.append(f"{len(diff.changed_tables)} tables changed")
-    
-    if summary:
-        lines.extend([
-            "## Summary",
-            ", ".join(summary),
-            ""
-        ])
-    
-    # Added Tables
-    lines.append("## Added Tables")
-    if diff.added_tables:
-        for table in sorted(diff.added_tables):
-            lines.append(f"- `{table}`")
-    else:
-        lines.append("_None_")
-    lines.append("")
-    
-    # Removed Tables
-    lines.append("## Removed Tables")
-    if diff.removed_tables:
-        for table in sorted(diff.removed_tables):
-            lines.append(f"- `{table}`")
-    else:
-        lines.append("_None_")
+    ]
+
+def _summary_lines(summary: Optional[str]) -> List[str]:
+    """Build the summary section."""
+    if not summary:
+        return []
+    return [
+        "## Summary",
+        summary,
+        ""
+    ]
+
+def _table_list_lines(title: str, tables: Iterable[str]) -> List[str]:
+    """Build a section listing table names."""
+    lines = [f"## {title}"]
+    items = [f"- `{table}`" for table in tables]
+    lines.extend(items or ["_None_"])
     lines.append("")
-    
+    return lines
+
+def _table_change_lines(table: TableView) -> List[str]:
+    """Build the column change lines for a single table."""
+    lines = [
+        f"### {table.name}",
+        ""
+    ]
+
+    if table.added_columns:
+        lines.append("Added columns:")
+        for column in table.added_columns:
+            lines.append(f"- {_format_column_view(column)}")
+        lines.append("")
+
+    if table.removed_columns:
+        lines.append("Removed columns:")
+        for column in table.removed_columns:
+            lines.append(f"- {_format_column_view(column)}")
+        lines.append("")
+    return lines
+
+def build_markdown(diff: SchemaDiff) -> str:
+    """Generate a Markdown report from schema differences."""
+    model = get_render_model(diff)
+    lines: List[str] = _header_lines()
+    lines.extend(_summary_lines(model.summary))
+    lines.extend(_table_list_lines("Added Tables", model.added_tables))
+    lines.extend(_table_list_lines("Removed Tables", model.removed_tables))
+
     # Column Changes
-    if diff.changed_tables:
-        lines.append("## Column Changes")
-        for table_name in sorted(diff.changed_tables.keys()):
-            table_diff = diff.changed_tables[table_name]
-            lines.extend([
-                f"### {table_name}",
-                ""
-            ])
-            
-            if table_diff.added_columns:
-                lines.append("Added columns:")
-                for col_name, col_info in sorted(table_diff.added_columns.items()):
-                    lines.append(f"- {format_column_info(col_name, col_info)}")
-                lines.append("")
-                
-            if table_diff.removed_columns:
-                lines.append("Removed columns:")
-                for col_name, col_info in sorted(table_diff.removed_columns.items()):
-                    lines.append(f"- {format_column_info(col_name, col_info)}")
-                lines.append("")
+    lines.append("## Column Changes")
+    if model.changed_tables:
+        for table in model.changed_tables:
+            lines.extend(_table_change_lines(table))
     else:
-        lines.append("## Column Changes")
         lines.append("_None_")
         lines.append("")
-    
+
     return "\n".join(lines)
+
+def stream_markdown(
+    changes: Iterable[TableChange],
+    out: TextIO,
+    spool_size: int = 1024 * 1024
+) -> None:
+    """Write a Markdown report from a name-ordered stream of table changes.
+
+    Produces the same report as ``build_markdown`` without materializing the
+    whole diff. Column changes are spooled (to disk once they exceed
+    ``spool_size`` characters) while the table names needed for the summary
+    and the added/removed sections are collected.
+    """
+    added: List[str] = []
+    removed: List[str] = []
+    changed = 0
+    with tempfile.SpooledTemporaryFile(max_size=spool_size, mode="w+") as spool:
+        for change in changes:
+            if change.status == 'added':
+                added.append(change.table)
+            elif change.status == 'removed':
+                removed.append(change.table)
+            else:
+                changed += 1
+                spool.write("\n")
+                spool.write("\n".join(
+                    _table_change_lines(build_table_view(change.table, change.diff))
+                ))
+
+        lines = _header_lines()
+        lines.extend(_summary_lines(build_summary(len(added), len(removed), changed)))
+        lines.extend(_table_list_lines("Added Tables", added))
+        lines.extend(_table_list_lines("Removed Tables", removed))
+        lines.append("## Column Changes")
+        if not changed:
+            lines.append("_None_")
+            lines.append("")
+        out.write("\n".join(lines))
+
+        if changed:
+            spool.seek(0)
+            shutil.copyfileobj(spool, out)
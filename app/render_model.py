@@ -0,0 +1,97 @@
+"""Shared render model for schema diff reports.
+
+Sorting and column formatting happen once per SchemaDiff here; the Markdown,
+HTML and Streamlit outputs all read from the resulting model.
+"""
+from dataclasses import dataclass
+from typing import Optional, Tuple
+from .db import ColumnInfo
+from .diff import SchemaDiff, TableDiff
+
+@dataclass(frozen=True)
+class ColumnView:
+    """A column with its attributes formatted for display."""
+    name: str
+    column_type: str
+    attributes: str
+
+@dataclass(frozen=True)
+class TableView:
+    """Sorted column changes for a single table."""
+    name: str
+    added_columns: Tuple[ColumnView, ...]
+    removed_columns: Tuple[ColumnView, ...]
+
+@dataclass(frozen=True)
+class RenderModel:
+    """Sorted, pre-formatted view of a SchemaDiff."""
+    added_tables: Tuple[str, ...]
+    removed_tables: Tuple[str, ...]
+    changed_tables: Tuple[TableView, ...]
+    summary: Optional[str]
+    has_changes: bool
+
+def format_attributes(info: ColumnInfo) -> str:
+    """Format nullability, default, key and extra into a readable string."""
+    parts = ["NULL" if info.is_nullable == "YES" else "NOT NULL"]
+
+    if info.column_default is not None:
+        parts.append(f"DEFAULT {info.column_default}")
+    if info.column_key:
+        parts.append(info.column_key)
+    if info.extra:
+        parts.append(info.extra)
+
+    return " ".join(parts)
+
+def build_column_view(column_name: str, info: ColumnInfo) -> ColumnView:
+    """Build the display view of a single column."""
+    return ColumnView(
+        name=column_name,
+        column_type=info.column_type,
+        attributes=format_attributes(info)
+    )
+
+def build_table_view(table_name: str, table_diff: TableDiff) -> TableView:
+    """Build the sorted display view of a table's column changes."""
+    return TableView(
+        name=table_name,
+        added_columns=tuple(
+            build_column_view(name, info)
+            for name, info in sorted(table_diff.added_columns.items())
+        ),
+        removed_columns=tuple(
+            build_column_view(name, info)
+            for name, info in sorted(table_diff.removed_columns.items())
+        )
+    )
+
+def build_summary(added: int, removed: int, changed: int) -> Optional[str]:
+    """Build the one-line summary from table counts."""
+    parts = []
+    if added:
+        parts.append(f"+{added} tables")
+    if removed:
+        parts.append(f"-{removed} tables")
+    if changed:
+        parts.append(f"{changed} tables changed")
+    return ", ".join(parts) if parts else None
+
+def get_render_model(diff: SchemaDiff) -> RenderModel:
+    """Return the render model for a diff, building and caching it on first use."""
+    if diff._render_model is None:
+        diff._render_model = RenderModel(
+            added_tables=tuple(sorted(diff.added_tables)),
+            removed_tables=tuple(sorted(diff.removed_tables)),
+            changed_tables=tuple(
+                build_table_view(name, table_diff)
+                for name, table_diff in sorted(diff.changed_tables.items())
+            ),
+            summary=build_summary(
+                len(diff.added_tables),
+                len(diff.removed_tables),
+                len(diff.changed_tables)
+            ),
+            has_changes=diff.has_changes
+        )
+    return diff._render_model